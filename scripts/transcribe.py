@@ -18,10 +18,16 @@ Usage:
 Environment variables:
     VOLCENGINE_APP_ID: Application ID from Volcengine Console
     VOLCENGINE_ACCESS_TOKEN: Access Token from Volcengine Console
+    VOLC_TOS_BUCKET, VOLC_TOS_ENDPOINT, VOLC_TOS_REGION,
+    VOLC_TOS_ACCESS_KEY, VOLC_TOS_SECRET_KEY: Optional object storage upload
 
 Requirements:
     - requests: pip install requests
     - python-dotenv (optional): pip install python-dotenv
+    - orjson, pybase64 (optional, faster uploads): pip install orjson pybase64
+    - httpx[http2] (optional, HTTP/2 for transcribe_many): pip install "httpx[http2]"
+    - boto3 (optional, --upload-bucket object storage upload): pip install boto3
+    - isal (optional, faster --gzip compression): pip install isal
     - FFmpeg: Required for video file processing (https://ffmpeg.org)
 
 Configuration:
@@ -36,32 +42,84 @@ Configuration:
 """
 
 import argparse
-import base64
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import glob
+import hashlib
+import importlib.util
 import json
 import logging
+import mmap
 import os
+import random
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import uuid
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 try:
     import requests
     import urllib3
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     # Disable SSL warnings for proxy environments
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 except ImportError:
     print("Error: requests library required. Install with: pip install requests")
     sys.exit(1)
 
+# python-dotenv is imported only when .env files are loaded
+DOTENV_AVAILABLE = importlib.util.find_spec("dotenv") is not None
+
+# Optional accelerators: SIMD base64 and a C JSON encoder
 try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# ISA-L gzip (python-isal) compresses request bodies several times faster than zlib
+try:
+    from isal.igzip import compress as gzip_compress
+    from isal.isal_zlib import compressobj
+except ImportError:
+    from gzip import compress as gzip_compress
+    from zlib import compressobj
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional HTTP/2 client for concurrent batches (transcribe_many)
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    # Requests are already logged by AudioTranscriber; drop httpx's INFO lines
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Optional object storage upload (TOS is S3-compatible)
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
+    from botocore.exceptions import ClientError
+    BOTO3_AVAILABLE = True
 except ImportError:
-    DOTENV_AVAILABLE = False
+    BOTO3_AVAILABLE = False
 
 # Logging configuration
 logging.basicConfig(
@@ -74,20 +132,111 @@ logger = logging.getLogger(__name__)
 API_URL = "https://openspeech.bytedance.com/api/v3/auc/bigmodel/recognize/flash"
 RESOURCE_ID = "volc.bigasr.auc_turbo"
 
+# HTTP connection pool and retry policy for gateway errors
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUS = (502, 503, 504)
+
+# Request body slice size for the HTTP/2 transport
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
 # Limits
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 RECOMMENDED_SIZE = 20 * 1024 * 1024  # 20MB
 
+# Kernel readahead hints for memory-mapped input files
+MMAP_ADVICE = ("MADV_SEQUENTIAL", "MADV_WILLNEED")
+
+# Request body fields shared by URL and file input
+REQUEST_USER = {"uid": "user"}
+REQUEST_PARAMS = {"model_name": "bigmodel"}
+
+# Request body compression level (see AudioTranscriber compress option)
+GZIP_LEVEL = 1
+
+# Base64 encoding chunk size (multiple of 3 so encoded chunks concatenate without padding)
+BASE64_CHUNK_SIZE = 57 * 1024
+
 # Status codes
 STATUS_SUCCESS = "20000000"
 STATUS_SILENT = "20000003"
 
+# FFmpeg audio extraction: output format -> (codec args, muxer)
+# Opus at 16kbps is transparent for speech and about half the size of MP3
+FFMPEG_FORMATS = {
+    "ogg": (["-acodec", "libopus", "-b:a", "16k", "-application", "voip"], "ogg"),
+    "mp3": (["-acodec", "libmp3lame"], "mp3"),
+    "wav": (["-acodec", "pcm_s16le"], "wav"),
+}
+PREFERRED_AUDIO_FORMATS = [("ogg", "libopus"), ("mp3", "libmp3lame")]  # (format, required encoder)
+FALLBACK_AUDIO_FORMAT = "wav"  # pcm_s16le is always built in
+# Source audio the API accepts as is: codec -> (output format, muxer). Low
+# bitrate tracks are stream-copied instead of decoded and re-encoded
+STREAM_COPY_FORMATS = {"mp3": ("mp3", "mp3"), "aac": ("aac", "adts"), "opus": ("ogg", "ogg")}
+# Copying skips the decode/encode pass (extraction becomes demux and I/O),
+# but keeps the source sample rate and channels and uploads up to 4x more
+# than 16kbps Opus; above this bitrate the larger upload outweighs it
+STREAM_COPY_MAX_BITRATE = 64000
+FFMPEG_TIMEOUT = 300  # 5 minutes
+FFMPEG_STDERR_LINES = 200  # Keep the last 200 stderr lines for error messages
+FFMPEG_PROGRESS_INTERVAL = 10.0  # Seconds between progress log lines
+FFMPEG_DRAIN_TIMEOUT = 5.0  # Seconds to wait for stderr EOF after FFmpeg exits
+
+# Segmented transcription of large files
+SEGMENT_TIME = 600  # 10 minutes
+SEGMENT_CONCURRENCY = 4
+
 # Supported formats
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"}
-VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".ts", ".m4v"}
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".ts", ".m4v"})
+# Extension -> file type, resolved with a single lookup
+_EXT_KIND = {
+    **{ext: "audio" for ext in AUDIO_EXTENSIONS},
+    **{ext: "video" for ext in VIDEO_EXTENSIONS},
+}
+
+# Result cache
+CACHE_DIR = Path.home() / ".volc-asr" / "cache"
+CACHE_MAX_SIZE = 200 * 1024 * 1024  # 200MB
+CACHE_SAMPLE_SIZE = 1024 * 1024  # Head and tail bytes keying large files
+HEAD_TIMEOUT = 10.0  # URL freshness check
+
+# Object storage upload
+UPLOAD_PREFIX = "volc-asr/"
+UPLOAD_PART_SIZE = 8 * 1024 * 1024  # 8MiB multipart parts
+UPLOAD_CONCURRENCY = 4
+PRESIGN_TTL = 3600  # Presigned GET URL lifetime in seconds
 
 # .env file names
 DOTENV_FILES = [".env", ".env.local"]
+_ENV_LOADED = False  # .env files are searched once per process
+# Every variable the script reads (the .env search can stop once all are set)
+ENV_VARS = (
+    "VOLCENGINE_APP_ID", "VOLCENGINE_ACCESS_TOKEN",
+    "VOLC_TOS_BUCKET", "VOLC_TOS_ENDPOINT", "VOLC_TOS_REGION",
+    "VOLC_TOS_ACCESS_KEY", "VOLC_TOS_SECRET_KEY",
+)
+
+
+def _env_search_paths() -> Iterator[Path]:
+    """Yield .env search directories in load order (parents are stat'ed lazily)"""
+    # 1. Script directory
+    yield Path(__file__).parent.parent
+
+    # 2. User config directory
+    yield Path.home() / ".volc-asr"
+
+    # 3. Current working directory and parents
+    cwd = Path.cwd()
+    yield cwd
+
+    for parent in cwd.parents:
+        yield parent
+        # Stop at reasonable depth (e.g., git root or drive root)
+        if (parent / ".git").exists() or parent.parent == parent:
+            break
 
 
 def load_env_files():
@@ -100,35 +249,22 @@ def load_env_files():
         2. User home directory (~/.volc-asr/.env)
         3. Current working directory
         4. Parent directories (up to root)
+
+    The search stops once every variable in ENV_VARS is set, since values
+    already in the environment are never overridden.
     """
-    if not DOTENV_AVAILABLE:
+    global _ENV_LOADED
+    if _ENV_LOADED or not DOTENV_AVAILABLE:
         return
+    _ENV_LOADED = True
 
-    # Paths to search for .env files
-    search_paths = []
-
-    # 1. Script directory
-    script_dir = Path(__file__).parent.parent
-    search_paths.append(script_dir)
-
-    # 2. User config directory
-    user_config_dir = Path.home() / ".volc-asr"
-    search_paths.append(user_config_dir)
-
-    # 3. Current working directory and parents
-    cwd = Path.cwd()
-    search_paths.append(cwd)
-
-    # Add parent directories
-    for parent in cwd.parents:
-        search_paths.append(parent)
-        # Stop at reasonable depth (e.g., git root or drive root)
-        if (parent / ".git").exists() or parent.parent == parent:
-            break
+    from dotenv import load_dotenv
 
     # Load .env files from search paths
     loaded_files = []
-    for base_path in search_paths:
+    for base_path in _env_search_paths():
+        if all(name in os.environ for name in ENV_VARS):
+            break
         for env_file in DOTENV_FILES:
             env_path = base_path / env_file
             if env_path.exists() and str(env_path) not in loaded_files:
@@ -153,9 +289,129 @@ class FFmpegNotFoundError(Exception):
     pass
 
 
+class FileTooLargeError(ValueError):
+    """Audio exceeds the API upload size limit"""
+    pass
+
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_path() -> Optional[str]:
+    """Resolved FFmpeg executable path, or None (PATH is searched once per process)"""
+    return shutil.which("ffmpeg")
+
+
 def check_ffmpeg() -> bool:
     """Check if FFmpeg is available"""
-    return shutil.which("ffmpeg") is not None
+    return ffmpeg_path() is not None
+
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_encoders() -> frozenset:
+    """Names of the audio encoders FFmpeg was built with (probed once per process)"""
+    if not check_ffmpeg():
+        return frozenset()
+    try:
+        output = subprocess.run(
+            [ffmpeg_path(), "-hide_banner", "-encoders"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+    # Lines look like " A....D libopus   libopus Opus (codec opus)"
+    return frozenset(
+        fields[1].decode("ascii", errors="replace")
+        for fields in (line.split() for line in output.splitlines())
+        if len(fields) > 1 and fields[0].startswith(b"A")
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def ffprobe_path() -> Optional[str]:
+    """Resolved ffprobe executable path, or None (PATH is searched once per process)"""
+    return shutil.which("ffprobe")
+
+
+def probe_audio_stream(path: Path) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Probe the codec and bitrate of the first audio stream
+
+    Uses ffprobe when installed, otherwise parses the stream summary that
+    ``ffmpeg -i`` prints.
+
+    Returns:
+        (codec name, bit rate in bits/s); either is None when unknown
+    """
+    use_ffprobe = ffprobe_path() is not None
+    if use_ffprobe:
+        cmd = [
+            ffprobe_path(), "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,bit_rate",
+            "-of", "default=noprint_wrappers=1",
+            str(path)
+        ]
+    else:
+        cmd = [ffmpeg_path(), "-hide_banner", "-nostdin", "-i", str(path)]
+    try:
+        output = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None, None
+
+    if use_ffprobe:
+        # Lines look like "codec_name=aac" and "bit_rate=64000" (or "N/A")
+        fields = dict(
+            line.split("=", 1) for line in output.stdout.decode("utf-8", errors="replace").splitlines()
+            if "=" in line
+        )
+        bit_rate = fields.get("bit_rate", "")
+        return fields.get("codec_name"), int(bit_rate) if bit_rate.isdigit() else None
+
+    # Lines look like "Stream #0:1(und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, mono, fltp, 64 kb/s"
+    for line in output.stderr.decode("utf-8", errors="replace").splitlines():
+        match = re.search(r"Stream #.*?: Audio: (\w+)", line)
+        if match:
+            bit_rate = re.search(r"(\d+) kb/s", line)
+            return match.group(1), int(bit_rate.group(1)) * 1000 if bit_rate else None
+    return None, None
+
+
+def extraction_format(path: Path, output_format: Optional[str] = None) -> Tuple[str, bool]:
+    """
+    Choose the extraction format for a media file
+
+    Without an explicit output_format, a low bitrate MP3/AAC/Opus track is
+    stream-copied (no decode or encode pass at all); anything else is
+    re-encoded to the most compact format FFmpeg supports.
+
+    Returns:
+        (output format, whether to stream-copy)
+    """
+    if output_format:
+        return output_format, False
+
+    codec, bit_rate = probe_audio_stream(path)
+    if codec in STREAM_COPY_FORMATS and bit_rate and bit_rate <= STREAM_COPY_MAX_BITRATE:
+        logger.info(f"Copying {codec} audio stream ({bit_rate // 1000} kb/s) without re-encoding")
+        return STREAM_COPY_FORMATS[codec][0], True
+    return default_audio_format(), False
+
+
+def default_audio_format() -> str:
+    """Most compact extraction format the installed FFmpeg can encode"""
+    encoders = ffmpeg_encoders()
+    for output_format, encoder in PREFERRED_AUDIO_FORMATS:
+        if encoder in encoders:
+            return output_format
+    return FALLBACK_AUDIO_FORMAT
 
 
 def get_file_type(file_path: Path) -> str:
@@ -165,17 +421,411 @@ def get_file_type(file_path: Path) -> str:
     Returns:
         'audio', 'video', or 'unknown'
     """
-    ext = file_path.suffix.lower()
-    if ext in AUDIO_EXTENSIONS:
-        return "audio"
-    elif ext in VIDEO_EXTENSIONS:
-        return "video"
-    return "unknown"
+    return file_type_for_suffix(file_path.suffix.lower())
+
+
+def file_type_for_suffix(ext: str) -> str:
+    """Determine file type from an already lower-cased extension (e.g. '.mp4')"""
+    return _EXT_KIND.get(ext, "unknown")
+
+
+def sniff_audio_format(path: Path) -> Optional[str]:
+    """
+    Identify an audio container from its leading magic bytes
+
+    Returns:
+        'mp3', 'aac', 'wav', 'ogg', 'flac' or 'm4a'; None if unrecognized
+    """
+    with open(path, "rb") as f:
+        head = f.read(12)
+
+    if head[:3] == b"ID3":
+        return "mp3"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # MPEG frame sync; layer bits 00 mean an ADTS (AAC) header
+        return "aac" if head[1] & 0x06 == 0 else "mp3"
+    if head[:4] in (b"RIFF", b"RF64") and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[4:8] == b"ftyp":
+        return "m4a"
+    if head[:4] == b"ADIF":
+        return "aac"
+    return None
+
+
+def expand_batch(pattern: str) -> List[Path]:
+    """
+    Expand a --batch argument into the media files it names
+
+    Args:
+        pattern: A directory or a glob pattern (``**`` matches subdirectories)
+
+    Returns:
+        list: Sorted paths of the matching audio/video files
+    """
+    path = Path(pattern)
+    candidates = path.iterdir() if path.is_dir() else map(Path, glob.glob(pattern, recursive=True))
+    return sorted(
+        p for p in candidates
+        if file_type_for_suffix(p.suffix.lower()) != "unknown" and p.is_file()
+    )
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available), optionally indented by 2"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Request IDs only need to be unique, not unpredictable: draw them from a
+# PRNG seeded once instead of calling os.urandom for every request
+_request_id_rng = random.Random(os.urandom(16))
+
+if hasattr(os, "register_at_fork"):
+    # Forked workers would otherwise generate the parent's sequence
+    os.register_at_fork(after_in_child=lambda: _request_id_rng.seed(os.urandom(16)))
+
+
+def new_request_id() -> str:
+    """Generate a UUID4-formatted request ID"""
+    return str(uuid.UUID(int=_request_id_rng.getrandbits(128), version=4))
+
+
+def build_request_body(audio: dict) -> bytes:
+    """Serialize the API request body for the given audio object"""
+    return json_dumps({"user": REQUEST_USER, "audio": audio, "request": REQUEST_PARAMS})
+
+
+def audio_body_frame() -> Tuple[bytes, bytes]:
+    """
+    Serialized request body before and after the base64 audio.data value
+
+    The base64 alphabet needs no JSON escaping, so encoders write the payload
+    directly between the prefix and suffix instead of it being run through
+    json.dumps (which would copy and scan the whole string again).
+    """
+    prefix, suffix = build_request_body({"data": "@@AUDIO@@"}).split(b"@@AUDIO@@")
+    return prefix, suffix
+
+
+def iter_stream_base64(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield base64 encoded chunks of a binary stream as it is read"""
+    pending = b""
+    for chunk in iter(lambda: stream.read(BASE64_CHUNK_SIZE), b""):
+        # Pipes may return short reads; only encode whole 3-byte groups
+        # until the end so no padding lands mid-stream
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 3
+        pending = chunk[usable:]
+        if usable:
+            yield b64encode(chunk[:usable])
+    if pending:
+        yield b64encode(pending)
+
+
+def encode_stream_base64(stream: BinaryIO, out: Optional[bytearray] = None) -> bytearray:
+    """
+    Base64-encode a binary stream in fixed-size chunks
+
+    Avoids holding the raw contents and their encoded copy in memory at
+    the same time, which matters for uploads close to MAX_FILE_SIZE.
+
+    Args:
+        stream: Readable binary stream (file or pipe)
+        out: Buffer to append to, e.g. a request body holding the JSON prefix
+             (default: new buffer)
+
+    Returns:
+        Buffer holding the base64 encoded contents (ASCII)
+    """
+    if out is None:
+        out = bytearray()
+    for chunk in iter_stream_base64(stream):
+        out += chunk
+    return out
+
+
+@contextlib.contextmanager
+def map_file(path: Path):
+    """
+    Memory-map a file read-only
+
+    The page cache is read in place, skipping the copy into a Python bytes
+    object that f.read() makes. Empty files (which cannot be mapped) yield b"".
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Ask the kernel to read ahead the whole file asynchronously, so
+            # disk reads overlap with encoding (Python 3.8+, POSIX only)
+            for advice in MMAP_ADVICE:
+                if hasattr(mm, "madvise") and hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+            yield mm
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file's content, memoized while the file is unchanged"""
+    st = os.stat(path)
+    return _file_sha256(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _file_sha256(path: str, size: int, mtime_ns: int) -> str:
+    # size and mtime_ns are part of the memo key only
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: readinto a reusable buffer, hashed by OpenSSL
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    h = hashlib.sha256()
+    with map_file(path) as data:
+        h.update(data)
+    return h.hexdigest()
+
+
+def encode_file_base64(path: Path, prefix: bytes = b"", suffix: bytes = b"") -> bytearray:
+    """
+    Base64-encode a file in fixed-size chunks of its memory map
+
+    The file size is known up front, so the output (optionally framed by
+    prefix and suffix, e.g. a JSON request body) is allocated once at its
+    exact size and filled in place instead of growing by reallocation.
+
+    Args:
+        path: Path to file
+        prefix: Bytes to place before the encoded data
+        suffix: Bytes to place after the encoded data
+
+    Returns:
+        prefix + base64 encoded file contents (ASCII) + suffix
+    """
+    with map_file(path) as data, memoryview(data) as view:
+        size = len(view)
+        out = bytearray(len(prefix) + 4 * ((size + 2) // 3) + len(suffix))
+        out[:len(prefix)] = prefix
+        pos = len(prefix)
+        for offset in range(0, size, BASE64_CHUNK_SIZE):
+            chunk = b64encode(view[offset:offset + BASE64_CHUNK_SIZE])
+            out[pos:pos + len(chunk)] = chunk
+            pos += len(chunk)
+        out[pos:] = suffix
+    return out
+
+
+def iter_file_base64(path: Path) -> Iterator[bytes]:
+    """Yield base64 encoded chunks of a file's memory map"""
+    with map_file(path) as data, memoryview(data) as view:
+        for offset in range(0, len(view), BASE64_CHUNK_SIZE):
+            yield b64encode(view[offset:offset + BASE64_CHUNK_SIZE])
+
+
+def remove_temp_files(temp_files: List[Path]):
+    """Remove temporary files, logging (not raising) failures"""
+    for temp_file in temp_files:
+        try:
+            if temp_file.exists():
+                temp_file.unlink()
+                logger.debug(f"Cleaned up temp file: {temp_file}")
+        except Exception as e:
+            logger.warning(f"Failed to cleanup temp file {temp_file}: {e}")
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip-compress a stream of chunks incrementally"""
+    compressor = compressobj(GZIP_LEVEL, 8, 31)  # DEFLATED, wbits 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Cleared for the rest of the process if the API rejects gzip bodies (HTTP 415)
+_gzip_accepted = True
+
+
+def _require_ffmpeg():
+    """Raise FFmpegNotFoundError if FFmpeg is not installed"""
+    if not check_ffmpeg():
+        raise FFmpegNotFoundError(
+            "FFmpeg is required for video processing. "
+            "Install from https://ffmpeg.org or via package manager:\n"
+            "  - Windows: winget install ffmpeg\n"
+            "  - macOS: brew install ffmpeg\n"
+            "  - Linux: apt install ffmpeg"
+        )
+
+
+def _build_extract_cmd(
+    video_path: Path,
+    output_format: str,
+    output: str,
+    segment_time: Optional[float] = None,
+    copy: bool = False
+) -> List[str]:
+    """
+    Build the FFmpeg command extracting 16kHz mono audio to `output`
+
+    With segment_time, output is a filename pattern (e.g. segment_%03d.ogg)
+    and the audio is split into consecutive segments of that many seconds.
+    With copy, the audio stream is remuxed as is (see extraction_format).
+    """
+    if copy:
+        # A copied stream keeps its sample rate and channels
+        muxer = next(m for f, m in STREAM_COPY_FORMATS.values() if f == output_format)
+        codec_args = ["-acodec", "copy"]
+    else:
+        codec_args, muxer = FFMPEG_FORMATS.get(output_format, FFMPEG_FORMATS["wav"])
+        codec_args = [*codec_args, "-ar", "16000", "-ac", "1"]  # 16kHz mono
+    if segment_time:
+        output_args = [
+            "-f", "segment",
+            "-segment_time", str(segment_time),
+            "-segment_format", muxer,
+            "-reset_timestamps", "1"  # Each segment starts at 0
+        ]
+    else:
+        output_args = ["-f", muxer]
+    return [
+        ffmpeg_path(),
+        "-nostdin",
+        "-loglevel", "error",  # Only errors on stderr...
+        "-nostats", "-progress", "pipe:2",  # ...plus machine-readable key=value progress
+        "-i", str(video_path),
+        "-map", "0:a:0",  # First audio stream only; other streams are never decoded
+        "-vn", "-sn", "-dn",  # No video, subtitle or data streams
+        "-threads", "0",  # Let FFmpeg pick the thread count per codec
+        *codec_args,
+        *output_args,
+        "-y",  # Overwrite
+        output
+    ]
+
+
+_PROGRESS_LINE = re.compile(rb"^[a-z0-9_]+=")
+
+
+def _drain_stderr(stream: BinaryIO, tail: collections.deque):
+    """
+    Read a stderr pipe line by line until EOF
+
+    Progress lines (``-progress pipe:2``) are logged at most every
+    FFMPEG_PROGRESS_INTERVAL seconds; other lines go to the bounded tail.
+    """
+    next_log = time.monotonic() + FFMPEG_PROGRESS_INTERVAL
+    progress = {}
+    for line in stream:
+        line = line.rstrip()
+        if not _PROGRESS_LINE.match(line):
+            tail.append(line)
+            continue
+        key, _, value = line.decode("ascii", errors="replace").partition("=")
+        progress[key] = value.strip()
+        # Each progress block ends with progress=continue (or =end)
+        if key == "progress" and time.monotonic() >= next_log:
+            next_log = time.monotonic() + FFMPEG_PROGRESS_INTERVAL
+            position = progress.get("out_time", "?").split(".")[0]  # 00:01:23.456000
+            logger.info(f"FFmpeg progress: {position} processed (speed {progress.get('speed', '?')})")
+
+
+def run_ffmpeg(cmd: List[str], read_stdout: Optional[Callable[[BinaryIO], Any]] = None) -> Any:
+    """
+    Run an FFmpeg command with constant memory use
+
+    stderr is drained line by line by a background thread, which logs
+    progress and keeps the last lines for the error message. stdout is handed to read_stdout
+    while FFmpeg runs (or discarded if not given).
+
+    Args:
+        cmd: FFmpeg command line
+        read_stdout: Optional callable consuming the stdout pipe
+
+    Returns:
+        Return value of read_stdout (None if not given)
+
+    Raises:
+        RuntimeError: If FFmpeg fails or exceeds FFMPEG_TIMEOUT
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE if read_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    tail = collections.deque(maxlen=FFMPEG_STDERR_LINES)
+    drain = threading.Thread(target=_drain_stderr, args=(proc.stderr, tail), daemon=True)
+    drain.start()
+
+    timed_out = threading.Event()
+
+    def on_timeout():
+        # read_stdout may still be uploading after FFmpeg exited; only a
+        # running FFmpeg process has timed out
+        if proc.poll() is None:
+            timed_out.set()
+            proc.kill()
+
+    timer = threading.Timer(FFMPEG_TIMEOUT, on_timeout)
+    timer.start()
+    output = None
+    failure = None
+    try:
+        try:
+            output = read_stdout(proc.stdout) if read_stdout else None
+        except Exception as e:
+            failure = e
+        else:
+            proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        # A process that outlived the kill (e.g. the child of an ffmpeg
+        # wrapper script) still holds stderr open; closing stdout makes its
+        # next write fail so it exits instead of blocking forever
+        if proc.stdout:
+            proc.stdout.close()
+        drain.join(FFMPEG_DRAIN_TIMEOUT)
+        # Closing a pipe the drain thread is still reading would block on
+        # its lock; an abandoned daemon thread ends with the process
+        if not drain.is_alive():
+            proc.stderr.close()
+
+    if timed_out.is_set():
+        raise RuntimeError("FFmpeg timeout: video file may be too large") from failure
+
+    # If the reader failed and FFmpeg exited with an error by itself (not
+    # killed above), the FFmpeg error is the root cause
+    if proc.returncode > 0 or (failure is None and proc.returncode != 0):
+        stderr = b"\n".join(tail)
+        raise RuntimeError(f"FFmpeg error: {stderr.decode('utf-8', errors='replace')}") from failure
+
+    if failure is not None:
+        raise failure
+
+    return output
 
 
 def extract_audio_from_video(
     video_path: Path,
-    output_format: str = "mp3",
+    output_format: Optional[str] = None,
     output_path: Optional[Path] = None
 ) -> Path:
     """
@@ -183,7 +833,8 @@ def extract_audio_from_video(
 
     Args:
         video_path: Path to video file
-        output_format: Output audio format (default: mp3)
+        output_format: Output audio format: ogg (Opus), mp3 or wav
+                       (default: ogg if FFmpeg has libopus, else mp3)
         output_path: Optional output path (default: temp file)
 
     Returns:
@@ -193,14 +844,8 @@ def extract_audio_from_video(
         FFmpegNotFoundError: If FFmpeg is not installed
         RuntimeError: If extraction fails
     """
-    if not check_ffmpeg():
-        raise FFmpegNotFoundError(
-            "FFmpeg is required for video processing. "
-            "Install from https://ffmpeg.org or via package manager:\n"
-            "  - Windows: winget install ffmpeg\n"
-            "  - macOS: brew install ffmpeg\n"
-            "  - Linux: apt install ffmpeg"
-        )
+    _require_ffmpeg()
+    output_format, copy = extraction_format(video_path, output_format)
 
     if output_path is None:
         # Create temp file
@@ -209,66 +854,480 @@ def extract_audio_from_video(
 
     logger.info(f"Extracting audio from video: {video_path}")
 
-    cmd = [
-        "ffmpeg",
-        "-i", str(video_path),
-        "-vn",  # No video
-        "-acodec", "libmp3lame" if output_format == "mp3" else "pcm_s16le",
-        "-ar", "16000",  # Sample rate
-        "-ac", "1",  # Mono
-        "-y",  # Overwrite
-        str(output_path)
-    ]
+    run_ffmpeg(_build_extract_cmd(video_path, output_format, str(output_path), copy=copy))
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+    if not output_path.exists():
+        raise RuntimeError("Audio extraction failed: output file not created")
+
+    logger.info(f"Audio extracted to: {output_path}")
+    return output_path
+
+
+def extract_audio_base64(
+    video_path: Path,
+    output_format: Optional[str] = None,
+    out: Optional[bytearray] = None
+) -> bytearray:
+    """
+    Extract audio track from video file and base64-encode it without a temp file
+
+    FFmpeg writes the audio to stdout, which is encoded chunk by chunk as it
+    arrives, so the audio never touches the disk.
+
+    Args:
+        video_path: Path to video file
+        output_format: Output audio format: ogg (Opus), mp3 or wav
+                       (default: ogg if FFmpeg has libopus, else mp3)
+        out: Buffer to append to (default: new buffer)
+
+    Returns:
+        Buffer holding the base64 encoded audio (ASCII)
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not installed
+        RuntimeError: If extraction fails
+    """
+    _require_ffmpeg()
+
+    logger.info(f"Extracting audio from video: {video_path}")
+
+    output_format, copy = extraction_format(video_path, output_format)
+    cmd = _build_extract_cmd(video_path, output_format, "pipe:1", copy=copy)
+    if out is None:
+        out = bytearray()
+    start = len(out)
+    run_ffmpeg(cmd, lambda stdout: encode_stream_base64(stdout, out))
+
+    logger.info(f"Audio extracted: {(len(out) - start) * 3 // 4 / 1024 / 1024:.1f}MB")
+    return out
+
+
+def split_audio(
+    audio_path: Path,
+    output_dir: Path,
+    segment_time: float = SEGMENT_TIME,
+    output_format: Optional[str] = None
+) -> List[Path]:
+    """
+    Split audio (or the audio track of a video) into fixed-length segments
+
+    Args:
+        audio_path: Path to audio or video file
+        output_dir: Directory for the segment files
+        segment_time: Segment length in seconds (default: 600)
+        output_format: Output audio format: ogg (Opus), mp3 or wav
+                       (default: ogg if FFmpeg has libopus, else mp3)
+
+    Returns:
+        Segment paths in playback order
+
+    Raises:
+        FFmpegNotFoundError: If FFmpeg is not installed
+        RuntimeError: If splitting fails
+    """
+    _require_ffmpeg()
+
+    output_format, copy = extraction_format(audio_path, output_format)
+
+    logger.info(f"Splitting audio into {segment_time:g}s segments: {audio_path}")
+
+    pattern = output_dir / f"segment_%03d.{output_format}"
+    run_ffmpeg(_build_extract_cmd(audio_path, output_format, str(pattern), segment_time, copy=copy))
+
+    segments = sorted(output_dir.glob(f"segment_*.{output_format}"))
+    if not segments:
+        raise RuntimeError("Audio split failed: no segments created")
+    return segments
+
+
+# Segment text boundaries that need a space: after ASCII text, before an ASCII word
+_ASCII_END = re.compile(r"[!-~]$")
+_ASCII_WORD_START = re.compile(r"[A-Za-z0-9]")
+
+
+def merge_results(results: List[dict]) -> dict:
+    """
+    Merge results of consecutive audio segments into one result
+
+    Utterance and word timestamps of each segment are shifted by the total
+    duration of the segments before it. Segment texts are joined without a
+    separator (Chinese has no spaces between words) unless they meet
+    between two ASCII words.
+    """
+    text = ""
+    utterances = []
+    offset = 0
+
+    for result in results:
+        for utterance in result.get("result", {}).get("utterances", []):
+            utterance = dict(
+                utterance,
+                start_time=utterance.get("start_time", 0) + offset,
+                end_time=utterance.get("end_time", 0) + offset
+            )
+            if "words" in utterance:
+                utterance["words"] = [
+                    dict(word, start_time=word.get("start_time", 0) + offset, end_time=word.get("end_time", 0) + offset)
+                    for word in utterance["words"]
+                ]
+            utterances.append(utterance)
+
+        segment_text = get_text(result)
+        if segment_text:
+            if text and _ASCII_END.search(text) and _ASCII_WORD_START.match(segment_text):
+                text += " "
+            text += segment_text
+        offset += result.get("audio_info", {}).get("duration", 0)
+
+    return {
+        "audio_info": {"duration": offset},
+        "result": {"text": text, "utterances": utterances}
+    }
+
+
+class ResultCache:
+    """
+    On-disk LRU cache of transcription results
+
+    Results are stored as JSON files named after a hash of the input file
+    (or of a URL and its ETag), so transcribing the same input again skips
+    the upload and API call. Least recently used entries are evicted once
+    the cache grows beyond max_size.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR, max_size: int = CACHE_MAX_SIZE):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cached results (default: ~/.volc-asr/cache)
+            max_size: Maximum total size of cached results in bytes (default: 200MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+    @staticmethod
+    def _new_hash() -> "hashlib._Hash":
+        """Create a SHA-256 hash seeded with the API settings that affect results"""
+        h = hashlib.sha256()
+        h.update(RESOURCE_ID.encode("utf-8"))
+        h.update(json_dumps(REQUEST_PARAMS))
+        return h
+
+    def key_for_file(self, path: Path) -> str:
+        """
+        Cache key for a local file
+
+        Audio files up to MAX_FILE_SIZE are keyed by a SHA-256 of their
+        content (OpenSSL uses SHA-NI where available). Videos and larger
+        files would cost a full read on every run, so they are keyed by
+        path, size, modification time and their first and last
+        CACHE_SAMPLE_SIZE bytes instead.
+        """
+        h = self._new_hash()
+        st = os.stat(path)
+        if file_type_for_suffix(path.suffix.lower()) == "audio" and st.st_size <= MAX_FILE_SIZE:
+            h.update(file_sha256(path).encode("ascii"))
+            return h.hexdigest()
+
+        h.update(f"{os.path.abspath(path)}\n{st.st_size}\n{st.st_mtime_ns}\n".encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read(CACHE_SAMPLE_SIZE))
+            if st.st_size > CACHE_SAMPLE_SIZE:
+                f.seek(max(CACHE_SAMPLE_SIZE, st.st_size - CACHE_SAMPLE_SIZE))
+                h.update(f.read(CACHE_SAMPLE_SIZE))
+        return h.hexdigest()
+
+    def key_for_url(self, url: str, etag: str) -> str:
+        """Cache key from URL and the ETag (or Last-Modified) of its content"""
+        h = self._new_hash()
+        h.update(f"{url}\n{etag}".encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return cached result, or None on miss"""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, "rb") as f:
+                result = json_loads(f.read())
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            logger.info(f"Cache miss: {key}")
+            return None
+        logger.info(f"Cache hit: {key}")
+        return result
+
+    def put(self, key: str, result: dict):
+        """Store result, then evict least recently used entries over max_size"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial JSON
+            temp_path = self.cache_dir / f"{key}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(json_dumps(result))
+            os.replace(temp_path, self.cache_dir / f"{key}.json")
+            self._evict()
+        except OSError as e:
+            logger.warning(f"Failed to write cache: {e}")
+
+    def _evict(self):
+        """Remove least recently used entries until under max_size"""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+                total -= size
+                logger.debug(f"Evicted cache entry: {path.name}")
+            except OSError:
+                pass
+
+
+class ObjectStorageUploader:
+    """
+    Upload local audio to TOS (or any S3-compatible storage) for URL transcription
+
+    Sending a presigned URL instead of base64 JSON saves a third of the
+    upload size and the server-side decode. Objects are keyed by content
+    hash, so a file already in the bucket is not uploaded again.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None
+    ):
+        """
+        Initialize uploader
+
+        Args:
+            bucket: Bucket name
+            endpoint_url: S3 endpoint (e.g. https://tos-s3-cn-beijing.volces.com)
+            region: Bucket region (e.g. cn-beijing)
+            access_key: Access key (default: boto3 credential chain)
+            secret_key: Secret key (default: boto3 credential chain)
+        """
+        if not BOTO3_AVAILABLE:
+            raise ImportError("boto3 is required for object storage upload. Install with: pip install boto3")
+
+        self.bucket = bucket
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            # TOS only accepts virtual-hosted style requests
+            config=BotoConfig(signature_version="s3v4", s3={"addressing_style": "virtual"})
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=UPLOAD_PART_SIZE,
+            multipart_chunksize=UPLOAD_PART_SIZE,
+            max_concurrency=UPLOAD_CONCURRENCY
+        )
+
+    def url_for(self, path: Path) -> str:
+        """Upload the file unless already stored, and return a presigned GET URL"""
+        key = f"{UPLOAD_PREFIX}{file_sha256(path)}{path.suffix.lower()}"
+
+        if self._exists(key):
+            logger.info(f"Already uploaded: {key}")
+        else:
+            logger.info(f"Uploading to object storage: {key}")
+            self._client.upload_file(str(path), self.bucket, key, Config=self._transfer_config)
+
+        return self._client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=PRESIGN_TTL
         )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg error: {result.stderr}")
+    def _exists(self, key: str) -> bool:
+        """Check whether an object is already stored"""
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
 
-        if not output_path.exists():
-            raise RuntimeError("Audio extraction failed: output file not created")
+class HTTP2Transport:
+    """
+    Send API requests from worker threads over a shared httpx.AsyncClient
 
-        logger.info(f"Audio extracted to: {output_path}")
-        return output_path
+    transcribe_many runs each transcription in a worker thread; this routes
+    their POSTs back to the event loop, where all of them are multiplexed
+    over a single HTTP/2 connection (one TLS handshake, HPACK-compressed
+    headers). httpx errors are mapped to the requests exceptions callers
+    already handle.
+    """
 
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("FFmpeg timeout: video file may be too large")
+    def __init__(self, client: "httpx.AsyncClient", loop: asyncio.AbstractEventLoop):
+        self._client = client
+        self._loop = loop
+
+    def post(self, body: Union[bytes, bytearray, Iterator[bytes]], headers: dict, timeout: float):
+        """POST to the API from a worker thread and wait for the response"""
+        if isinstance(body, (bytes, bytearray)):
+            # Sent as slices of the existing buffer: converting a multi-MB
+            # bytearray with bytes() would copy the whole payload again
+            headers = dict(headers, **{"Content-Length": str(len(body))})
+            attempts = RETRY_TOTAL + 1
+        else:
+            chunks = self._aiter(body)
+            attempts = 1  # A consumed stream cannot be resent
+
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            content = self._aiter_buffer(body) if isinstance(body, (bytes, bytearray)) else chunks
+            future = asyncio.run_coroutine_threadsafe(
+                self._client.post(API_URL, content=content, headers=headers, timeout=timeout),
+                self._loop
+            )
+            try:
+                response = future.result()
+            except httpx.ConnectTimeout as e:
+                raise requests.exceptions.ConnectTimeout(str(e)) from e
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            if response.status_code not in RETRY_STATUS:
+                break
+        return response
+
+    @staticmethod
+    async def _aiter_buffer(body: Union[bytes, bytearray]):
+        """Yield a request body buffer in upload-sized slices"""
+        with memoryview(body) as view:
+            for offset in range(0, len(view), UPLOAD_CHUNK_SIZE):
+                yield bytes(view[offset:offset + UPLOAD_CHUNK_SIZE])
+
+    async def _aiter(self, chunks: Iterator[bytes]):
+        """Pull a blocking chunk iterator from the default executor"""
+        while True:
+            chunk = await self._loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+# Transport for the current transcribe_many worker (None: use requests session)
+_request_transport = contextvars.ContextVar("request_transport", default=None)
 
 
 class AudioTranscriber:
     """Audio/Video transcriber using Volcengine Doubao ASR Flash API"""
 
-    def __init__(self, appid: str, token: str):
+    def __init__(
+        self,
+        appid: str,
+        token: str,
+        cache: Optional[ResultCache] = None,
+        compress: bool = False,
+        stream_upload: bool = False,
+        segment_time: Optional[float] = None,
+        uploader: Optional[ObjectStorageUploader] = None
+    ):
         """
         Initialize transcriber
 
         Args:
             appid: Volcengine Application ID
             token: Volcengine Access Token
+            cache: Optional result cache; repeated inputs skip the API call
+            compress: Gzip request bodies (Content-Encoding: gzip) to cut upload size
+            stream_upload: Send audio with chunked transfer encoding while it is
+                           still being extracted (video) or base64-encoded (audio
+                           files), falling back to a buffered upload if the
+                           server rejects it
+            segment_time: Split videos, and audio files larger than 20MB, into segments of this
+                          many seconds, transcribed concurrently and merged. Files
+                          over the 100MB limit are always split (default length 600s)
+            uploader: Upload local audio to object storage and transcribe it by
+                      presigned URL instead of sending it base64-encoded
         """
         self.appid = appid
         self.token = token
+        self.cache = cache
+        self.compress = compress
+        self.stream_upload = stream_upload
+        self.segment_time = segment_time
+        self.uploader = uploader
         self._temp_files = []  # Track temp files for cleanup
+        # API headers are added to API requests only; the session is also
+        # used for URL freshness checks, which must not carry credentials
+        self._headers = {
+            "X-Api-App-Key": appid,
+            "X-Api-Access-Key": token,
+            "X-Api-Resource-Id": RESOURCE_ID,
+            "X-Api-Sequence": "-1",
+            "Content-Type": "application/json"
+        }
+        self._session = self._create_session()
+        # A consumed generator body cannot be replayed by urllib3 retries
+        # (it would resend an empty body); _post_streamed resends only
+        # requests that failed before the body was sent
+        self._stream_session = self._create_session(retry=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
-        """Cleanup temp files"""
+        """Close the HTTP sessions and cleanup temp files"""
+        for name in ("_session", "_stream_session"):
+            session = getattr(self, name, None)
+            if session is not None:
+                session.close()
+        self._cleanup_temp_files()
+
+    @staticmethod
+    def _create_session(retry: bool = True) -> "requests.Session":
+        """Create HTTP session with keep-alive connection pooling and (optionally) retries"""
+        retries = Retry(
+            total=RETRY_TOTAL,
+            read=False,  # A read timeout means the POST reached the API: never resubmit it
+            other=0,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS,
+            allowed_methods=None,  # Retry POST on connect errors and RETRY_STATUS only
+            raise_on_status=False
+        ) if retry else 0
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retries
+        ))
+        return session
+
+    def close(self):
+        """Close the HTTP sessions and remove temporary files"""
+        self._session.close()
+        self._stream_session.close()
         self._cleanup_temp_files()
 
     def _cleanup_temp_files(self):
-        """Remove temporary files"""
-        for temp_file in self._temp_files:
-            try:
-                if temp_file.exists():
-                    temp_file.unlink()
-                    logger.debug(f"Cleaned up temp file: {temp_file}")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp file {temp_file}: {e}")
+        """Remove temporary files kept by earlier transcriptions"""
+        remove_temp_files(self._temp_files)
         self._temp_files = []
 
     def transcribe(
@@ -302,89 +1361,401 @@ class AudioTranscriber:
         if url and file:
             raise ValueError("Provide either 'url' or 'file', not both")
 
+        cache_key = self._cache_key(url, file) if self.cache is not None else None
+        if cache_key:
+            result = self.cache.get(cache_key)
+            if result is not None:
+                return result
+
+        # Temp files are tracked per call so concurrent transcriptions
+        # (see transcribe_many) never remove each other's files
+        temp_files = []
         try:
             if file:
-                return self._transcribe_file(file, timeout)
+                result = self._transcribe_file(file, timeout, temp_files, keep_temp)
             else:
-                return self._transcribe_url(url, timeout)
+                result = self._transcribe_url(url, timeout)
         finally:
-            if not keep_temp:
-                self._cleanup_temp_files()
+            if keep_temp:
+                self._temp_files.extend(temp_files)
+            else:
+                remove_temp_files(temp_files)
+
+        if cache_key:
+            self.cache.put(cache_key, result)
+        return result
+
+    def _cache_key(self, url: Optional[str], file: Optional[Union[str, Path]]) -> Optional[str]:
+        """Cache key for the input, or None if it cannot be cached"""
+        if file:
+            try:
+                return self.cache.key_for_file(Path(file))
+            except OSError:
+                return None  # Missing file is reported by _transcribe_file
+
+        # Remote content is identified by its ETag; without one it may change
+        try:
+            response = self._session.head(url, timeout=HEAD_TIMEOUT, allow_redirects=True, verify=False)
+        except requests.exceptions.RequestException:
+            return None
+        version = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if not response.ok or not version:
+            return None
+        return self.cache.key_for_url(url, version)
+
+    async def transcribe_many(
+        self,
+        items: Iterable[Union[str, Path, dict]],
+        max_concurrent: int = 5
+    ) -> list:
+        """
+        Transcribe multiple inputs concurrently
+
+        Each transcription runs in a worker thread, so network waits overlap
+        while a semaphore caps the number of requests in flight. With httpx
+        (and h2) installed, requests share one HTTP/2 connection when the
+        server negotiates it.
+
+        Args:
+            items: Local file paths, or dicts of keyword arguments for transcribe()
+                   (e.g. {"url": "https://..."} or {"file": "a.mp4", "timeout": 600})
+            max_concurrent: Maximum concurrent transcriptions (default: 5)
+
+        Returns:
+            list: Results in input order; failed items hold the raised exception
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+        loop = asyncio.get_event_loop()
+
+        async with contextlib.AsyncExitStack() as stack:
+            # Dedicated workers: the default executor stays free for
+            # HTTP2Transport to pull streamed request bodies
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent)
+            stack.callback(executor.shutdown, wait=False)
+
+            context = contextvars.copy_context()
+            if HTTPX_AVAILABLE:
+                client = await stack.enter_async_context(httpx.AsyncClient(
+                    http2=True,
+                    verify=False,  # Disable SSL verification for proxy environments
+                    # HTTP/2 multiplexes onto one connection anyway; the cap only
+                    # matters when the server falls back to HTTP/1.1
+                    limits=httpx.Limits(max_connections=max_concurrent, max_keepalive_connections=max_concurrent)
+                ))
+                context.run(_request_transport.set, HTTP2Transport(client, loop))
+
+            async def run_one(item):
+                kwargs = item if isinstance(item, dict) else {"file": item}
+                call = functools.partial(context.copy().run, self.transcribe, **kwargs)
+                async with semaphore:
+                    return await loop.run_in_executor(executor, call)
+
+            return await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
 
     def _transcribe_url(self, url: str, timeout: float) -> dict:
         """Transcribe from URL"""
         logger.info(f"Transcribing from URL: {url}")
 
-        body = {
-            "user": {"uid": "user"},
-            "audio": {"url": url},
-            "request": {"model_name": "bigmodel"}
-        }
+        body = build_request_body({"url": url})
 
         return self._call_api(body, timeout)
 
-    def _transcribe_file(self, file_path: Union[str, Path], timeout: float) -> dict:
+    def _transcribe_file(
+        self,
+        file_path: Union[str, Path],
+        timeout: float,
+        temp_files: List[Path],
+        keep_temp: bool
+    ) -> dict:
         """Transcribe from local file (audio or video)"""
         path = Path(file_path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        # One stat serves both the existence check and the size limits
+        try:
+            file_size = path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
-        file_type = get_file_type(path)
+        ext = path.suffix.lower()
+        file_type = file_type_for_suffix(ext)
 
         if file_type == "video":
             # Extract audio from video
-            logger.info(f"Detected video file: {path.suffix}")
-            audio_path = extract_audio_from_video(path)
-            self._temp_files.append(audio_path)
-            path = audio_path
-        elif file_type == "unknown":
-            logger.warning(f"Unknown file type: {path.suffix}, attempting as audio")
-
-        file_size = path.stat().st_size
+            logger.info(f"Detected video file: {ext}")
+            if self.segment_time:
+                # FFmpeg extracts and splits the audio track in one pass
+                return self._transcribe_segments(path, self.segment_time, timeout, temp_files, keep_temp)
+            if keep_temp or self.uploader is not None:
+                audio_path = extract_audio_from_video(path)
+                temp_files.append(audio_path)
+                path = audio_path
+                file_size = path.stat().st_size
+            elif self.stream_upload:
+                return self._stream_video(path, timeout, temp_files, keep_temp)
+            else:
+                # No temp file needed: encode FFmpeg output as it is produced
+                return self._upload_video(path, timeout, temp_files, keep_temp)
+        else:
+            if file_type == "unknown":
+                logger.warning(f"Unknown file type: {ext}, attempting as audio")
+            # Reject non-audio data before encoding and uploading it
+            if sniff_audio_format(path) is None:
+                raise ValueError(f"Not a supported audio file (unrecognized header): {path}")
+
         logger.info(f"Transcribing file: {path} ({file_size / 1024 / 1024:.1f}MB)")
 
+        segment_time = self._segment_time_for(file_size)
+        if segment_time:
+            return self._transcribe_segments(path, segment_time, timeout, temp_files, keep_temp)
+
+        self._check_size(file_size)
+        return self._upload_file(path, timeout)
+
+    def _segment_time_for(self, file_size: int) -> Optional[float]:
+        """Segment length to split a file of this size into, or None to upload it whole"""
+        if file_size > MAX_FILE_SIZE and check_ffmpeg():
+            return self.segment_time or SEGMENT_TIME
+        if file_size > RECOMMENDED_SIZE and self.segment_time and check_ffmpeg():
+            return self.segment_time
+        return None
+
+    @staticmethod
+    def _check_size(file_size: int):
+        """Enforce the upload size limit"""
         if file_size > MAX_FILE_SIZE:
-            raise ValueError(f"File too large: {file_size / 1024 / 1024:.1f}MB (max: 100MB)")
+            raise FileTooLargeError(f"File too large: {file_size / 1024 / 1024:.1f}MB (max: 100MB)")
 
         if file_size > RECOMMENDED_SIZE:
             logger.warning(f"File larger than recommended 20MB, upload may be slow")
 
-        # Read and encode file
-        with open(path, "rb") as f:
-            audio_data = base64.b64encode(f.read()).decode("utf-8")
+    def _upload_file(self, path: Path, timeout: float) -> dict:
+        """Upload a local audio file"""
+        if self.uploader is not None:
+            body = build_request_body({"url": self.uploader.url_for(path)})
+            return self._call_api(body, timeout)
+
+        # Audio is encoded straight into the request body between the JSON
+        # prefix and suffix, so the payload is never copied to frame it
+        prefix, suffix = audio_body_frame()
+        if self.stream_upload:
+            # Encoding overlaps the upload; a rejected stream is re-encoded
+            return self._post_streamed(
+                iter_file_base64(path),
+                lambda: encode_file_base64(path, prefix, suffix),
+                timeout
+            )
+        body = encode_file_base64(path, prefix, suffix)
 
-        body = {
-            "user": {"uid": "user"},
-            "audio": {"data": audio_data},
-            "request": {"model_name": "bigmodel"}
-        }
+        return self._call_api(body, timeout)
 
+    def _upload_video(self, video_path: Path, timeout: float, temp_files: List[Path], keep_temp: bool) -> dict:
+        """Extract the audio of a video and upload it, split into segments if too large"""
+        prefix, suffix = audio_body_frame()
+        body = extract_audio_base64(video_path, out=bytearray(prefix))
+
+        file_size = (len(body) - len(prefix)) * 3 // 4
+        if file_size > MAX_FILE_SIZE:
+            # The audio size is only known once extracted
+            logger.info(f"Extracted audio too large ({file_size / 1024 / 1024:.1f}MB), splitting into segments")
+            del body
+            return self._transcribe_segments(video_path, SEGMENT_TIME, timeout, temp_files, keep_temp)
+
+        logger.info(f"Transcribing extracted audio ({file_size / 1024 / 1024:.1f}MB)")
+        self._check_size(file_size)
+
+        body += suffix
         return self._call_api(body, timeout)
 
-    def _call_api(self, body: dict, timeout: float) -> dict:
-        """Make API call"""
-        request_id = str(uuid.uuid4())
+    def _transcribe_segments(
+        self,
+        path: Path,
+        segment_time: float,
+        timeout: float,
+        temp_files: List[Path],
+        keep_temp: bool
+    ) -> dict:
+        """Split a large file, transcribe the segments concurrently and merge the results"""
+        segment_dir = Path(tempfile.mkdtemp(prefix="volc-asr-"))
+        try:
+            segments = split_audio(path, segment_dir, segment_time)
+            logger.info(f"Transcribing {len(segments)} segments")
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=SEGMENT_CONCURRENCY) as executor:
+                results = list(executor.map(lambda segment: self._upload_file(segment, timeout), segments))
+        finally:
+            if keep_temp:
+                temp_files.extend(sorted(segment_dir.iterdir()))
+            else:
+                shutil.rmtree(segment_dir, ignore_errors=True)
 
-        headers = {
-            "X-Api-App-Key": self.appid,
-            "X-Api-Access-Key": self.token,
-            "X-Api-Resource-Id": RESOURCE_ID,
-            "X-Api-Request-Id": request_id,
-            "X-Api-Sequence": "-1",
-            "Content-Type": "application/json"
-        }
+        return merge_results(results)
 
-        logger.info(f"Sending request (ID: {request_id})")
+    def _stream_video(self, video_path: Path, timeout: float, temp_files: List[Path], keep_temp: bool) -> dict:
+        """
+        Transcribe video with FFmpeg extraction, encoding and upload pipelined
+
+        FFmpeg's stdout is base64-encoded into a chunked request body, so the
+        upload starts before extraction finishes. The encoded audio is also
+        kept so the request can be resent with a buffered body if the
+        streamed one does not reach the API. Audio that outgrows the upload
+        limit aborts the upload and the video is transcribed in segments.
+        """
+        _require_ffmpeg()
 
-        response = requests.post(
+        logger.info(f"Streaming audio from video: {video_path}")
+
+        output_format, copy = extraction_format(video_path)
+        cmd = _build_extract_cmd(video_path, output_format, "pipe:1", copy=copy)
+        try:
+            return run_ffmpeg(cmd, lambda stdout: self._upload_stream(stdout, timeout))
+        except FileTooLargeError as e:
+            logger.info(f"{e}, splitting into segments")
+            return self._transcribe_segments(video_path, SEGMENT_TIME, timeout, temp_files, keep_temp)
+
+    def _upload_stream(self, stream: BinaryIO, timeout: float) -> dict:
+        """Upload a binary stream as base64 audio data using chunked transfer encoding"""
+        prefix, suffix = audio_body_frame()
+        buffered = bytearray(prefix)
+
+        def encoded():
+            # A pipe cannot be read twice, so keep a copy for the fallback
+            for chunk in iter_stream_base64(stream):
+                buffered.extend(chunk)
+                # Raising here aborts the chunked body before it is complete
+                if (len(buffered) - len(prefix)) * 3 // 4 > MAX_FILE_SIZE:
+                    raise FileTooLargeError("Extracted audio exceeds the 100MB upload limit")
+                yield chunk
+
+        chunks = encoded()
+
+        def fallback():
+            for _ in chunks:  # Read the rest of the stream
+                pass
+            buffered.extend(suffix)
+            return buffered
+
+        return self._post_streamed(chunks, fallback, timeout)
+
+    def _post_streamed(
+        self,
+        chunks: Iterator[bytes],
+        fallback: Callable[[], bytearray],
+        timeout: float
+    ) -> dict:
+        """
+        POST base64 audio chunks as a chunked request body
+
+        Args:
+            chunks: Base64 encoded audio chunks, framed here by the JSON body
+            fallback: Returns the complete buffered body, used if the streamed
+                      request fails before its body can have been accepted
+                      (connection failure, or a non-API rejection such as a
+                      proxy refusing chunked bodies)
+        """
+        prefix, suffix = audio_body_frame()
+
+        def body():
+            yield prefix
+            yield from chunks
+            yield suffix
+
+        # Anything that may have reached the API is not resent: it may
+        # already have been processed (and billed)
+        try:
+            response = self._post(body(), timeout)
+        except requests.exceptions.ConnectionError as e:
+            if not self._failed_to_connect(e):
+                raise
+            logger.warning(f"Streamed upload failed to connect ({e}), retrying with buffered body")
+            response = None
+        else:
+            # Without an API status header the request was rejected before
+            # reaching the API (e.g. a proxy refusing chunked bodies); a
+            # gateway error may come after the API accepted the body
+            if (
+                "X-Api-Status-Code" not in response.headers
+                and not response.ok
+                and response.status_code not in RETRY_STATUS
+            ):
+                logger.warning(f"Streamed upload rejected (HTTP {response.status_code}), retrying with buffered body")
+                response = None
+
+        if response is None:
+            response = self._post(fallback(), timeout)
+
+        return self._handle_response(response)
+
+    @staticmethod
+    def _failed_to_connect(error: "requests.exceptions.ConnectionError") -> bool:
+        """Whether a request failed while connecting, before any of its body was sent"""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if HTTPX_AVAILABLE and isinstance(error.__cause__, httpx.ConnectError):
+            return True
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, urllib3.exceptions.MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+    def _call_api(self, body: Union[bytes, bytearray], timeout: float) -> dict:
+        """Make API call with a pre-serialized JSON body"""
+        return self._handle_response(self._post(body, timeout))
+
+    def _post(self, body: Union[bytes, bytearray, Iterator[bytes]], timeout: float) -> "requests.Response":
+        """POST a JSON body (bytes, or an iterator of chunks for chunked transfer)"""
+        global _gzip_accepted
+        request_id = new_request_id()
+
+        headers = {"X-Api-Request-Id": request_id}
+
+        data = body
+        compressed = self.compress and _gzip_accepted
+        if compressed:
+            # Level 1: most of the size win at a fraction of the CPU cost
+            if isinstance(body, (bytes, bytearray)):
+                data = gzip_compress(body, compresslevel=GZIP_LEVEL)
+                logger.debug(f"Compressed request body: {len(body)} -> {len(data)} bytes")
+            else:
+                data = gzip_stream(body)
+            headers["Content-Encoding"] = "gzip"
+
+        logger.info(f"Sending request (ID: {request_id})")
+        response = self._send(data, headers, timeout)
+
+        if compressed and response.status_code == 415:
+            _gzip_accepted = False
+            logger.warning("Server rejected gzip request body (HTTP 415), sending uncompressed from now on")
+            # A consumed stream cannot be resent here; _post_streamed falls back
+            if isinstance(body, (bytes, bytearray)):
+                return self._post(body, timeout)
+        return response
+
+    def _send(self, body: Union[bytes, bytearray, Iterator[bytes]], headers: dict, timeout: float):
+        """Send a request body with the API and per-request headers over the active transport"""
+        headers = dict(self._headers, **headers)
+
+        transport = _request_transport.get()
+        if transport is not None:
+            return transport.post(body, headers, timeout)
+
+        session = self._session if isinstance(body, (bytes, bytearray)) else self._stream_session
+        return session.post(
             API_URL,
-            json=body,
+            data=body,
             headers=headers,
             timeout=timeout,
             verify=False  # Disable SSL verification for proxy environments
         )
 
+    @staticmethod
+    def _handle_response(response: "requests.Response") -> dict:
+        """Check API status headers and return the parsed result"""
         status_code = response.headers.get("X-Api-Status-Code", "")
         message = response.headers.get("X-Api-Message", "Unknown error")
         log_id = response.headers.get("X-Tt-Logid", "")
@@ -392,10 +1763,10 @@ class AudioTranscriber:
         logger.info(f"Response: {status_code} - {message} (LogId: {log_id})")
 
         if status_code == STATUS_SUCCESS:
-            return response.json()
+            return json_loads(response.content)
         elif status_code == STATUS_SILENT:
             logger.warning("Audio appears to be silent")
-            return response.json()
+            return json_loads(response.content)
         else:
             raise TranscriptionError(status_code, message)
 
@@ -411,10 +1782,64 @@ def get_duration(result: dict) -> float:
     return ms / 1000
 
 
-def main():
-    # Load .env files first
-    load_env_files()
+def run_batch(transcriber: AudioTranscriber, files: List[Path], args: argparse.Namespace) -> int:
+    """
+    Transcribe files concurrently and write one JSON line per file
+
+    Returns:
+        int: Number of files that failed
+    """
+    logger.info(f"Batch transcribing {len(files)} files (concurrency: {args.concurrency})")
+    items = [{"file": str(p), "timeout": args.timeout, "keep_temp": args.keep_temp} for p in files]
+    results = asyncio.run(transcriber.transcribe_many(items, max_concurrent=args.concurrency))
+
+    lines = []
+    failed = 0
+    for path, result in zip(files, results):
+        if isinstance(result, Exception):
+            failed += 1
+            logger.error(f"{path}: {result}")
+            lines.append(json_dumps({"file": str(path), "error": str(result)}))
+            continue
+
+        if args.text_only:
+            record = {"file": str(path), "text": get_text(result)}
+        else:
+            record = {"file": str(path), "result": result}
+        lines.append(json_dumps(record))
 
+        if not args.no_auto_save:
+            try:
+                with open(path.with_suffix(".txt"), "w", encoding="utf-8") as f:
+                    f.write(get_text(result))
+            except Exception as e:
+                logger.warning(f"Failed to auto-save {path}: {e}")
+
+    output = b"\n".join(lines)
+    if args.output:
+        Path(args.output).write_bytes(output + b"\n")
+        logger.info(f"Results saved to: {args.output}")
+    else:
+        print(output.decode("utf-8"))
+
+    logger.info(f"Batch finished: {len(files) - failed} succeeded, {failed} failed")
+    return failed
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process)"""
     parser = argparse.ArgumentParser(
         description="Volcengine Doubao ASR Flash - Audio/Video Transcription",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -438,6 +1863,12 @@ Examples:
     # With explicit credentials
     python transcribe.py --file "./audio.mp3" --appid YOUR_ID --token YOUR_TOKEN
 
+    # Transcribe a directory (or glob) concurrently, one JSON line per file
+    python transcribe.py --batch "./recordings/*.mp3" --concurrency 8
+
+    # Several files at once (same JSON lines output)
+    python transcribe.py --file a.mp3 b.mp4 c.wav --jobs 4
+
 Credentials (priority: CLI args > .env file > environment variables):
     1. Create a .env file in one of these locations:
        - Script directory: audio-transcription-skill/.env
@@ -460,7 +1891,9 @@ Supported formats:
 
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument("--url", help="Audio file URL")
-    input_group.add_argument("--file", "-f", help="Local audio or video file path")
+    input_group.add_argument("--file", "-f", nargs="+",
+                             help="Local audio or video file path(s); several files run concurrently")
+    input_group.add_argument("--batch", help="Directory or glob pattern of files to transcribe concurrently")
 
     parser.add_argument("--appid", help="Volcengine App ID (overrides .env and env vars)")
     parser.add_argument("--token", help="Volcengine Access Token (overrides .env and env vars)")
@@ -471,12 +1904,31 @@ Supported formats:
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--no-env", action="store_true", help="Skip loading .env files")
     parser.add_argument("--no-auto-save", action="store_true", help="Disable auto-save to video directory")
+    parser.add_argument("--stream-upload", action="store_true", help="Upload audio while it is extracted/encoded (chunked transfer)")
+    parser.add_argument("--segment-time", type=float,
+                        help="Split videos and audio files over 20MB into segments of N seconds, transcribed in parallel")
+    parser.add_argument("--gzip", action="store_true", help="Gzip-compress the request body (upload size)")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the result cache")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR,
+                        help="Result cache directory (default: ~/.volc-asr/cache)")
+    parser.add_argument("--upload-bucket",
+                        help="Upload local audio to this TOS/S3 bucket and transcribe by URL (env: VOLC_TOS_BUCKET)")
+    parser.add_argument("--concurrency", "--jobs", "-j", type=_positive_int, default=5,
+                        help="Maximum concurrent transcriptions for several files (default: 5)")
+
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    args = _build_parser().parse_args()
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Load .env files only once the arguments are valid (not for --help)
+    if not args.no_env:
+        load_env_files()
+
     # Get credentials (priority: CLI args > .env > environment variables)
     appid = args.appid or os.environ.get("VOLCENGINE_APP_ID")
     token = args.token or os.environ.get("VOLCENGINE_ACCESS_TOKEN")
@@ -497,9 +1949,20 @@ Supported formats:
         print("      Install with: pip install python-dotenv")
         sys.exit(1)
 
+    # Several files (or --batch) are transcribed concurrently as JSON lines
+    batch_files = None
+    if args.batch:
+        batch_files = expand_batch(args.batch)
+        if not batch_files:
+            logger.error(f"No files match: {args.batch}")
+            sys.exit(1)
+    elif args.file and len(args.file) > 1:
+        batch_files = [Path(f) for f in args.file]
+    file = args.file[0] if args.file and batch_files is None else None
+
     # Check FFmpeg for video files
-    if args.file:
-        file_path = Path(args.file)
+    if file:
+        file_path = Path(file)
         if file_path.suffix.lower() in VIDEO_EXTENSIONS and not check_ffmpeg():
             print("Error: FFmpeg is required for video file processing")
             print("Install FFmpeg from https://ffmpeg.org or via package manager:")
@@ -509,30 +1972,52 @@ Supported formats:
             sys.exit(1)
 
     # Create transcriber
-    transcriber = AudioTranscriber(appid, token)
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    upload_bucket = args.upload_bucket or os.environ.get("VOLC_TOS_BUCKET")
+    try:
+        uploader = ObjectStorageUploader(
+            upload_bucket,
+            endpoint_url=os.environ.get("VOLC_TOS_ENDPOINT"),
+            region=os.environ.get("VOLC_TOS_REGION"),
+            access_key=os.environ.get("VOLC_TOS_ACCESS_KEY"),
+            secret_key=os.environ.get("VOLC_TOS_SECRET_KEY")
+        ) if upload_bucket else None
+    except ImportError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    transcriber = AudioTranscriber(appid, token, cache=cache, compress=args.gzip,
+                                  stream_upload=args.stream_upload, segment_time=args.segment_time,
+                                  uploader=uploader)
+
+    if batch_files:
+        try:
+            failed = run_batch(transcriber, batch_files, args)
+        finally:
+            transcriber.close()
+        sys.exit(1 if failed else 0)
 
     try:
         # Run transcription
         result = transcriber.transcribe(
             url=args.url,
-            file=args.file,
+            file=file,
             timeout=args.timeout,
             keep_temp=args.keep_temp
         )
 
-        # Format output
+        # Format output as UTF-8 bytes, written without re-encoding
         if args.text_only:
-            output = get_text(result)
+            output = get_text(result).encode("utf-8")
         else:
-            output = json.dumps(result, ensure_ascii=False, indent=2)
+            output = json_dumps(result, indent=True)
 
         # Write or print
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(output)
+            Path(args.output).write_bytes(output)
             logger.info(f"Result saved to: {args.output}")
         else:
-            print(output)
+            print(output.decode("utf-8"))
 
         # Log summary
         duration = get_duration(result)
@@ -540,8 +2025,8 @@ Supported formats:
         logger.info(f"Duration: {duration:.1f}s, Text length: {text_len} chars")
 
         # Auto-save to video directory (if file input and not disabled)
-        if args.file and not args.no_auto_save:
-            auto_save_path = Path(args.file).with_suffix(".txt")
+        if file and not args.no_auto_save:
+            auto_save_path = Path(file).with_suffix(".txt")
             try:
                 with open(auto_save_path, "w", encoding="utf-8") as f:
                     f.write(get_text(result))
@@ -567,6 +2052,8 @@ Supported formats:
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        transcriber.close()
 
 
 if __name__ == "__main__":